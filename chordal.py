@@ -1,8 +1,7 @@
 from collections import defaultdict
 from heapq import heappush as push, heappop as pop
-import random
 
-import networkx as nx
+from csr import CSRGraph
 
 
 class MaxTuple:
@@ -92,6 +91,8 @@ def is_chordal(graph):
 def chromatic_number_and_max_clique(G):
     order = lex_bfs(G)
     n = len(order)
+    if n == 0:
+        return 0
     color = [-1] * (max(G.nodes()) + 1)
     for i in range(n):
         node = order[i]
@@ -113,6 +114,8 @@ def chromatic_number_and_max_clique(G):
 def max_independent_set_and_min_vertex_cover(G):
     order = lex_bfs(G)[::-1]
     n = len(order)
+    if n == 0:
+        return 0
     vis = [False] * (max(G.nodes()) + 1)
 
     independent_set = []
@@ -156,48 +159,59 @@ def complement_graph2choral(graph):
         graph.add_edge(u, v)
 
 
-def random_subgraph(G, fraction=0.1):
-    if not 0 < fraction <= 1:
-        raise ValueError("Fraction should be between 0 and 1.")
-    nodes = list(G.nodes())
-    num_nodes_to_keep = int(len(nodes) * fraction)
-    nodes_to_keep = random.sample(nodes, num_nodes_to_keep)
-    subgraph = G.subgraph(nodes_to_keep).copy()
-
-    return subgraph
-
-
-def make_chordal_from_cliques(graph):
-    marked = set()
+def maximal_chordal_subgraph(graph):
+    # Dearing-Shier-Warner greedy: number the node whose chosen neighbors form the
+    # largest clique, and let it join the clique of each neighbor it covers. Every
+    # node is kept and the returned mask over graph.indices marks a maximal set of
+    # edges forming a chordal subgraph. Each bucket is a heap, so ties go to the
+    # lowest node id.
+    indptr, indices = graph.indptr, graph.indices
+    n = len(graph)
 
-    for clique in nx.find_cliques(graph):
-        if any(node in marked for node in clique):
-            continue
+    chosen = [set() for _ in range(n)]
+    numbered = [False] * n
+    buckets = [list(range(n))]
+    size = 0
+
+    for _ in range(n):
+        while True:
+            while not buckets[size]:
+                size -= 1
+            node = pop(buckets[size])
+            if not numbered[node] and len(chosen[node]) == size:
+                break
 
-        for node in clique:
-            marked.add(node)
+        numbered[node] = True
+        clique = chosen[node]
+        for neighbor in indices[indptr[node]:indptr[node + 1]]:
+            if not numbered[neighbor] and chosen[neighbor] <= clique:
+                chosen[neighbor].add(node)
+                k = len(chosen[neighbor])
+                if k == len(buckets):
+                    buckets.append([])
+                push(buckets[k], neighbor)
+                size = max(size, k)
 
-    subgraph = graph.subgraph(list(marked)).copy()
+    mask = bytearray(len(indices))
+    for node in range(n):
+        for pos in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[pos]
+            if neighbor in chosen[node] or node in chosen[neighbor]:
+                mask[pos] = 1
 
-    return subgraph
+    return mask
 
 
 def make_chordal_iter(graph):
-    while len(graph.nodes()) > 10000 or len(graph.edges()) > 50000:
-        graph = random_subgraph(graph, random.uniform(0.7, 0.9))
-
-    graph = make_chordal_from_cliques(graph)
-
-    while not is_chordal(graph):
-        # print("graph", graph.number_of_edges())
-        complement_graph2choral(graph)
+    # Returns a CSRGraph whose node ids are positions in .labels, not the input's ids
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_networkx(graph)
 
-        if len(graph.edges()) > 50000:
-            graph = random_subgraph(graph, random.uniform(0.7, 0.9))
+    return graph.edge_subgraph(maximal_chordal_subgraph(graph))
 
-    return graph
 
 if __name__ == "__main__":
+    import networkx as nx
 
     from gen_chordal import gen_graph, make_chordal, UnionFind
 
@@ -0,0 +1,162 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+from chordal import is_chordal, chromatic_number_and_max_clique, max_independent_set_and_min_vertex_cover, \
+    complement_graph2choral, make_chordal_iter
+from csr import read_edge_list, UnsupportedFormatError
+
+BENCH_IMPORTS = ['csr', 'chordal', 'cli', 'networkx']
+
+
+def measure_import_time(module):
+    # Run in a fresh interpreter so nothing is already in sys.modules
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    proc = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                          cwd=os.path.dirname(os.path.abspath(__file__)))
+    if proc.returncode != 0:
+        return None
+    return float(proc.stdout)
+
+
+def measure_execution_time(func, *args):
+    start_time = time.perf_counter()
+    result = func(*args)
+    end_time = time.perf_counter()
+    return result, end_time - start_time
+
+
+def load(path):
+    # Report unreadable files and keep going with the remaining paths
+    try:
+        return read_edge_list(path)
+    except OSError as e:
+        print(f"{path}: {e.strerror or e}", file=sys.stderr)
+        return None
+
+
+def recognize(args):
+    status = 0
+    for path in args.paths:
+        graph = load(path)
+        if graph is None:
+            status = 1
+            continue
+        result = is_chordal(graph)
+        print(f"{path}: {result}")
+        if not result:
+            status = 1
+    return status
+
+
+def run_on_chordal(paths, func):
+    # The LexBFS based counts are only exact on chordal graphs
+    status = 0
+    for path in paths:
+        graph = load(path)
+        if graph is None:
+            status = 1
+            continue
+        if not is_chordal(graph):
+            print(f"{path}: not chordal, run triangulate first", file=sys.stderr)
+            status = 1
+            continue
+        print(f"{path}: {func(graph)}")
+    return status
+
+
+def color(args):
+    return run_on_chordal(args.paths, chromatic_number_and_max_clique)
+
+
+def mis(args):
+    return run_on_chordal(args.paths, max_independent_set_and_min_vertex_cover)
+
+
+def triangulate(args):
+    # Adding fill edges needs a mutable graph, so this is the one command that imports networkx
+    graph = load(args.path)
+    if graph is None:
+        return 1
+    G = graph.to_networkx()
+    while not is_chordal(G):
+        complement_graph2choral(G)
+
+    out = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        for u, v in G.edges():
+            out.write(f"{u} {v}\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def bench(args):
+    for module in BENCH_IMPORTS:
+        elapsed = measure_import_time(module)
+        if elapsed is None:
+            print(f"import {module}: unavailable")
+        else:
+            print(f"import {module}: {elapsed:.6f}")
+
+    status = 0
+    for path in args.paths:
+        graph, read_time = measure_execution_time(load, path)
+        if graph is None:
+            status = 1
+            continue
+        chordal, chordal_time = measure_execution_time(is_chordal, graph)
+        print(f"(\"{os.path.basename(path)}\", {graph.number_of_nodes()} + {graph.number_of_edges()}, "
+              f"read {read_time:.6f}, is_chordal {chordal_time:.6f}", end="")
+        if not chordal:
+            graph, subgraph_time = measure_execution_time(make_chordal_iter, graph)
+            print(f", make_chordal_iter {graph.number_of_edges()} {subgraph_time:.6f}", end="")
+        _, color_time = measure_execution_time(chromatic_number_and_max_clique, graph)
+        _, mis_time = measure_execution_time(max_independent_set_and_min_vertex_cover, graph)
+        print(f", chromatic_number_and_max_clique {color_time:.6f}, "
+              f"max_independent_set_and_min_vertex_cover {mis_time:.6f}),")
+    return status
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Linear time algorithms on chordal graphs.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    p = subparsers.add_parser('recognize', help="check whether edge lists are chordal (exit status 1 if not)")
+    p.add_argument('paths', nargs='+')
+    p.set_defaults(func=recognize)
+
+    p = subparsers.add_parser('color', help="chromatic number of chordal edge lists (exit status 1 if any is not chordal)")
+    p.add_argument('paths', nargs='+')
+    p.set_defaults(func=color)
+
+    p = subparsers.add_parser('mis', help="maximum independent set size of chordal edge lists (exit status 1 if any is not chordal)")
+    p.add_argument('paths', nargs='+')
+    p.set_defaults(func=mis)
+
+    p = subparsers.add_parser('triangulate', help="add fill edges until the graph is chordal (needs networkx)")
+    p.add_argument('path')
+    p.add_argument('-o', '--output', help="write the edge list here instead of stdout")
+    p.set_defaults(func=triangulate)
+
+    p = subparsers.add_parser('bench', help="time imports and the algorithms on edge lists")
+    p.add_argument('paths', nargs='*')
+    p.set_defaults(func=bench)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args)
+    except UnsupportedFormatError as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+import gzip
+import sys
+from array import array
+
+
+class UnsupportedFormatError(ValueError):
+    pass
+
+
+# Compressed sparse row graph: the neighbors of node v are
+# indices[indptr[v]:indptr[v + 1]]. Nodes are relabelled to 0..n-1 and
+# labels[v] keeps the original id. Only the standard library is used so
+# that loading and recognizing an edge list does not import networkx.
+class CSRGraph:
+    def __init__(self, indptr, indices, labels=None):
+        self.indptr = indptr
+        self.indices = indices
+        self.labels = labels if labels is not None else list(range(len(indptr) - 1))
+
+    @classmethod
+    def from_edges(cls, edges):
+        node_index = {}
+        labels = []
+        pairs = set()
+
+        for u, v in edges:
+            for node in (u, v):
+                if node not in node_index:
+                    node_index[node] = len(labels)
+                    labels.append(node)
+            u, v = node_index[u], node_index[v]
+            if u == v:
+                continue
+            pairs.add((u, v) if u < v else (v, u))
+
+        n = len(labels)
+        degree = [0] * n
+        for u, v in pairs:
+            degree[u] += 1
+            degree[v] += 1
+
+        indptr = array('l', [0] * (n + 1))
+        for i in range(n):
+            indptr[i + 1] = indptr[i] + degree[i]
+
+        pos = list(indptr[:n])
+        indices = array('l', [0] * indptr[n])
+        for u, v in sorted(pairs):
+            indices[pos[u]] = v
+            pos[u] += 1
+            indices[pos[v]] = u
+            pos[v] += 1
+
+        return cls(indptr, indices, labels)
+
+    @classmethod
+    def from_networkx(cls, graph):
+        csr = cls.from_edges(graph.edges())
+        isolated = [node for node in graph.nodes() if graph.degree(node) == 0]
+        if not isolated:
+            return csr
+        n = len(csr)
+        indptr = csr.indptr + array('l', [csr.indptr[n]] * len(isolated))
+        return cls(indptr, csr.indices, csr.labels + isolated)
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    def nodes(self):
+        return range(len(self))
+
+    def neighbors(self, node):
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    def degree(self, node):
+        return self.indptr[node + 1] - self.indptr[node]
+
+    def edges(self):
+        for u in self.nodes():
+            for v in self.neighbors(u):
+                if u < v:
+                    yield u, v
+
+    def edge_subgraph(self, mask):
+        indptr = array('l', [0] * (len(self) + 1))
+        indices = array('l')
+        for u in self.nodes():
+            for pos in range(self.indptr[u], self.indptr[u + 1]):
+                if mask[pos]:
+                    indices.append(self.indices[pos])
+            indptr[u + 1] = len(indices)
+        return CSRGraph(indptr, indices, self.labels)
+
+    def number_of_nodes(self):
+        return len(self)
+
+    def number_of_edges(self):
+        return len(self.indices) // 2
+
+    def to_networkx(self):
+        import networkx as nx
+
+        G = nx.Graph()
+        G.add_nodes_from(self.labels)
+        G.add_edges_from((self.labels[u], self.labels[v]) for u, v in self.edges())
+        return G
+
+
+def _parse_edges(lines, file_path, sep=None):
+    for line in lines:
+        if line.startswith('#') or not line.strip():
+            continue
+        try:
+            u, v = line.split(sep)[:2]
+            yield int(u), int(v)
+        except ValueError:
+            print(f"Skipping invalid line in {file_path}: {line!r}", file=sys.stderr)
+
+
+def _tar_lines(file_path):
+    import tarfile
+
+    with tarfile.open(file_path, 'r:gz') as tar:
+        for member in tar.getmembers():
+            if member.isfile() and member.name.endswith('.txt'):
+                with tar.extractfile(member) as f:
+                    for line in f:
+                        yield line.decode('utf-8')
+
+
+def read_edge_list(file_path):
+    if file_path.endswith('.tar.gz'):
+        return CSRGraph.from_edges(_parse_edges(_tar_lines(file_path), file_path))
+
+    if file_path.endswith(('.txt.gz', '.csv.gz')):
+        f = gzip.open(file_path, 'rt', encoding='utf-8')
+    elif file_path.endswith(('.txt', '.csv')):
+        f = open(file_path, encoding='utf-8')
+    else:
+        raise UnsupportedFormatError(f"Unsupported edge list format: {file_path}")
+
+    sep = ',' if file_path.endswith(('.csv', '.csv.gz')) else None
+    with f:
+        return CSRGraph.from_edges(_parse_edges(f, file_path, sep))
@@ -1,6 +1,3 @@
-import matplotlib.pyplot as plt
-import numpy as np
-
 # Data from the provided log
 datasets = [
     ("facebook_combined.txt.gz", 4039, 88234, 0.234001, 703, 12728, 0.030000, 478, 9804, 0.015001,),
@@ -19,6 +16,9 @@ datasets = [
 
 
 def plot_scatter_with_trendline(x, y, title, ylabel, filename):
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     plt.figure(figsize=(10, 6))
     plt.scatter(x, y, label='Data Points')
 
@@ -37,20 +37,21 @@ def plot_scatter_with_trendline(x, y, title, ylabel, filename):
     plt.show()
 
 
-# Scatter plot for is_chordal with trend line
-plot_scatter_with_trendline(edges_1, is_chordal_times,
-                            'Execution Time for is_chordal Algorithm',
-                            'Execution Time (seconds)',
-                            'is_chordal_timing_graph.pdf')
-
-# Scatter plot for chromatic_number_and_max_clique with trend line
-plot_scatter_with_trendline(edges_2, chromatic_times,
-                            'Execution Time for chromatic_number_and_max_clique Algorithm',
-                            'Execution Time (seconds)',
-                            'chromatic_number_and_max_clique_timing_graph.pdf')
-
-# Scatter plot for max_independent_set_and_min_vertex_cover with trend line
-plot_scatter_with_trendline(edges_3, independent_set_times,
-                            'Execution Time for max_independent_set_and_min_vertex_cover Algorithm',
-                            'Execution Time (seconds)',
-                            'max_independent_set_and_min_vertex_cover_timing_graph.pdf')
+if __name__ == "__main__":
+    # Scatter plot for is_chordal with trend line
+    plot_scatter_with_trendline(edges_1, is_chordal_times,
+                                'Execution Time for is_chordal Algorithm',
+                                'Execution Time (seconds)',
+                                'is_chordal_timing_graph.pdf')
+
+    # Scatter plot for chromatic_number_and_max_clique with trend line
+    plot_scatter_with_trendline(edges_2, chromatic_times,
+                                'Execution Time for chromatic_number_and_max_clique Algorithm',
+                                'Execution Time (seconds)',
+                                'chromatic_number_and_max_clique_timing_graph.pdf')
+
+    # Scatter plot for max_independent_set_and_min_vertex_cover with trend line
+    plot_scatter_with_trendline(edges_3, independent_set_times,
+                                'Execution Time for max_independent_set_and_min_vertex_cover Algorithm',
+                                'Execution Time (seconds)',
+                                'max_independent_set_and_min_vertex_cover_timing_graph.pdf')
@@ -4,8 +4,6 @@ from itertools import combinations
 import networkx as nx
 from collections import defaultdict
 
-from tqdm import tqdm
-
 
 # Union-Find Implementation
 class UnionFind:
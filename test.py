@@ -1,8 +1,19 @@
+import gzip
+import io
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
 import unittest
+from contextlib import redirect_stderr, redirect_stdout
 import time
 import networkx as nx
 
-from chordal import is_chordal, chromatic_number_and_max_clique, max_independent_set_and_min_vertex_cover
+from chordal import is_chordal, chromatic_number_and_max_clique, max_independent_set_and_min_vertex_cover, \
+    maximal_chordal_subgraph
+import cli
+from csr import CSRGraph, read_edge_list
 from gen_chordal import gen_chordal, gen_graph
 
 
@@ -111,5 +122,146 @@ class MyTestCase(unittest.TestCase):
         print(f"Average time for large max independent set: {sum(large_times) / len(large_times):.6f} seconds")
 
 
+class CSRGraphTestCase(unittest.TestCase):
+
+    def test_matches_networkx(self):
+        for i in range(100):
+            G = gen_graph(50, 0.2)
+            csr = CSRGraph.from_networkx(G)
+            self.assertEqual(csr.number_of_nodes(), G.number_of_nodes())
+            self.assertEqual(csr.number_of_edges(), G.number_of_edges())
+            self.assertEqual(is_chordal(csr), nx.is_chordal(G))
+            self.assertTrue(nx.utils.graphs_equal(csr.to_networkx(), G))
+
+        for i in range(100):
+            G = gen_chordal(50, 0.2)
+            csr = CSRGraph.from_networkx(G)
+            self.assertEqual(chromatic_number_and_max_clique(csr), chromatic_number_and_max_clique(G))
+            self.assertEqual(max_independent_set_and_min_vertex_cover(csr),
+                             max_independent_set_and_min_vertex_cover(G))
+
+    def test_maximal_chordal_subgraph(self):
+        for i in range(100):
+            G = gen_graph(30, 0.2)
+            csr = CSRGraph.from_networkx(G)
+            sub = csr.edge_subgraph(maximal_chordal_subgraph(csr)).to_networkx()
+            self.assertEqual(sub.number_of_nodes(), G.number_of_nodes())
+            self.assertTrue(nx.is_chordal(sub))
+            for u, v in G.edges():
+                if not sub.has_edge(u, v):
+                    sub.add_edge(u, v)
+                    self.assertFalse(nx.is_chordal(sub))
+                    sub.remove_edge(u, v)
+
+        for i in range(100):
+            G = gen_chordal(50, 0.2)
+            csr = CSRGraph.from_networkx(G)
+            self.assertEqual(sum(maximal_chordal_subgraph(csr)), 2 * G.number_of_edges())
+
+    def test_maximal_chordal_subgraph_ties(self):
+        # After node 0, nodes 1 and 2 tie; the lower id is numbered first and keeps (1, 3)
+        csr = CSRGraph.from_edges([(0, 1), (0, 2), (1, 3), (2, 3)])
+        sub = csr.edge_subgraph(maximal_chordal_subgraph(csr))
+        self.assertEqual(sorted(sub.edges()), [(0, 1), (0, 2), (1, 3)])
+
+    def test_read_edge_list(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'g.txt')
+            with open(path, 'w') as f:
+                f.write("# comment\n10 20\n20 10\n10 20\n30 30\n20 40 7\n\nbad line\n")
+            with redirect_stderr(io.StringIO()) as err:
+                G = read_edge_list(path)
+            self.assertEqual(G.labels, [10, 20, 30, 40])
+            self.assertEqual(G.number_of_edges(), 2)
+            self.assertEqual(sorted(G.edges()), [(0, 1), (1, 3)])
+            self.assertIn('bad line', err.getvalue())
+
+            path = os.path.join(tmp, 'g.csv.gz')
+            with gzip.open(path, 'wt') as f:
+                f.write("src,dst,weight\n1,2,5\n2,3,-1\n")
+            with redirect_stderr(io.StringIO()) as err:
+                G = read_edge_list(path)
+            self.assertEqual(G.labels, [1, 2, 3])
+            self.assertEqual(G.number_of_edges(), 2)
+            self.assertIn('src,dst', err.getvalue())
+
+            member = os.path.join(tmp, 'member.txt')
+            with open(member, 'w') as f:
+                f.write("1 2\n2 3\n3 1\n")
+            path = os.path.join(tmp, 'g.tar.gz')
+            with tarfile.open(path, 'w:gz') as tar:
+                tar.add(member, arcname='member.txt')
+            G = read_edge_list(path)
+            self.assertEqual(G.number_of_nodes(), 3)
+            self.assertEqual(G.number_of_edges(), 3)
+
+            with self.assertRaises(ValueError):
+                read_edge_list(os.path.join(tmp, 'g.edges'))
+
+    def test_lazy_imports(self):
+        code = "import sys, cli, draw; print(any(m in sys.modules for m in ('networkx', 'matplotlib', 'tqdm')))"
+        proc = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(proc.stdout.strip(), 'False')
+
+
+class CLITestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.chordal = os.path.join(self.tmp.name, 'chordal.txt')
+        with open(self.chordal, 'w') as f:
+            f.write("0 1\n1 2\n0 2\n2 3\n")
+        self.cycle = os.path.join(self.tmp.name, 'cycle.txt')
+        with open(self.cycle, 'w') as f:
+            f.write("0 1\n1 2\n2 3\n3 4\n4 0\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_main(self, argv):
+        with redirect_stdout(io.StringIO()) as out, redirect_stderr(io.StringIO()):
+            status = cli.main(argv)
+        return status, out.getvalue()
+
+    def test_recognize(self):
+        self.assertEqual(self.run_main(['recognize', self.chordal]), (0, f"{self.chordal}: True\n"))
+        status, out = self.run_main(['recognize', self.chordal, self.cycle])
+        self.assertEqual(status, 1)
+        self.assertIn(f"{self.cycle}: False", out)
+
+    def test_color_and_mis(self):
+        self.assertEqual(self.run_main(['color', self.chordal]), (0, f"{self.chordal}: 3\n"))
+        self.assertEqual(self.run_main(['mis', self.chordal]), (0, f"{self.chordal}: 2\n"))
+        self.assertEqual(self.run_main(['color', self.cycle]), (1, ""))
+        self.assertEqual(self.run_main(['mis', self.cycle]), (1, ""))
+
+    def test_empty_edge_list(self):
+        path = os.path.join(self.tmp.name, 'empty.txt')
+        with open(path, 'w') as f:
+            f.write("# only comments\n\n")
+        self.assertEqual(self.run_main(['recognize', path]), (0, f"{path}: True\n"))
+        self.assertEqual(self.run_main(['color', path]), (0, f"{path}: 0\n"))
+        self.assertEqual(self.run_main(['mis', path]), (0, f"{path}: 0\n"))
+
+    def test_missing_path(self):
+        missing = os.path.join(self.tmp.name, 'missing.txt')
+        for command in ['recognize', 'color', 'mis']:
+            status, out = self.run_main([command, missing, self.chordal])
+            self.assertEqual(status, 1)
+            self.assertNotIn(missing, out)
+            self.assertIn(self.chordal, out)
+        self.assertEqual(self.run_main(['triangulate', missing]), (1, ""))
+
+    def test_triangulate_output(self):
+        output = os.path.join(self.tmp.name, 'out.txt')
+        status, out = self.run_main(['triangulate', self.cycle, '-o', output])
+        self.assertEqual((status, out), (0, ""))
+        G = nx.read_edgelist(output, nodetype=int)
+        self.assertTrue(nx.is_chordal(G))
+        for u, v in [(0, 1), (1, 2), (2, 3), (3, 4), (4, 0)]:
+            self.assertTrue(G.has_edge(u, v))
+
+
 if __name__ == '__main__':
     unittest.main()